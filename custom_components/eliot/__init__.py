@@ -2,11 +2,11 @@
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
+from homeassistant.core import HomeAssistant, callback
 
-from .const import CONF_SCAN_INTERVAL, DOMAIN
-from .coordinator import EliotDataUpdateCoordinator
+from .const import CONF_SCAN_INTERVAL, DATA_ACCOUNTS, DOMAIN
+from .coordinator import EliotAccountCoordinator, EliotDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,18 +17,54 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up ElioT from a config entry."""
     coordinator = EliotDataUpdateCoordinator(hass, entry)
 
-    # Fetch initial data so we have data when entities subscribe
-    await coordinator.async_config_entry_first_refresh()
-
-    # Store coordinator in hass.data for access by sensor platform
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
-
-    # Register update listener for options changes
-    entry.async_on_unload(entry.add_update_listener(async_update_options))
-
-    # Forward setup to sensor platform
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Share one device list poller between all entries of the same account
+    accounts: dict[tuple[str, str], EliotAccountCoordinator] = (
+        hass.data.setdefault(DATA_ACCOUNTS, {})
+    )
+    account_key = (entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD])
+    account = accounts.get(account_key)
+    created = account is None
+    if account is None:
+        account = EliotAccountCoordinator(hass, *account_key)
+        accounts[account_key] = account
+
+    # Register before any await so concurrent setups keep the poller alive
+    account.entry_ids.add(entry.entry_id)
+
+    try:
+        if created:
+            await account.async_refresh()
+
+        if (
+            account.last_update_success
+            and account.data is not None
+            and coordinator.eui not in account.data
+        ):
+            # Don't query a device that is gone, load it as unavailable instead
+            _LOGGER.warning(
+                "Device %s is no longer on the account, not polling it",
+                coordinator.eui,
+            )
+            coordinator.async_set_device_removed(True)
+        else:
+            # Fetch initial data so we have data when entities subscribe
+            await coordinator.async_config_entry_first_refresh()
+
+        # Store coordinator in hass.data for access by sensor platform
+        hass.data.setdefault(DOMAIN, {})
+        hass.data[DOMAIN][entry.entry_id] = coordinator
+
+        entry.async_on_unload(coordinator.async_attach_account(account))
+
+        # Register update listener for options changes
+        entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+        # Forward setup to sensor platform
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except Exception:
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        _async_release_account(hass, entry)
+        raise
 
     return True
 
@@ -41,7 +77,8 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     if CONF_SCAN_INTERVAL in entry.options:
         new_interval = entry.options[CONF_SCAN_INTERVAL]
         coordinator.update_interval_seconds(new_interval)
-        await coordinator.async_request_refresh()
+        if not coordinator.device_removed:
+            await coordinator.async_request_refresh()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -51,4 +88,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
+        _async_release_account(hass, entry)
+
     return unload_ok
+
+
+@callback
+def _async_release_account(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the account poller once its last entry is gone."""
+    accounts: dict[tuple[str, str], EliotAccountCoordinator] = hass.data[
+        DATA_ACCOUNTS
+    ]
+    account_key = (entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD])
+    account = accounts.get(account_key)
+    if account is not None:
+        account.entry_ids.discard(entry.entry_id)
+        if not account.entry_ids:
+            accounts.pop(account_key)
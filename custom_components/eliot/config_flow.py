@@ -71,6 +71,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._username = None
         self._password = None
         self._devices = []
+        self._eui = None
 
     @staticmethod
     @callback
@@ -167,6 +168,40 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_integration_discovery(
+        self, discovery_info: dict[str, Any]
+    ) -> FlowResult:
+        """Handle a device found on the account by background discovery."""
+        self._username = discovery_info[CONF_USERNAME]
+        self._password = discovery_info[CONF_PASSWORD]
+        self._eui = discovery_info[CONF_EUI]
+
+        await self.async_set_unique_id(self._eui)
+        self._abort_if_unique_id_configured()
+
+        self.context["title_placeholders"] = {"name": f"ElioT {self._eui}"}
+
+        return await self.async_step_discovery_confirm()
+
+    async def async_step_discovery_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Confirm adding a discovered device."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title=f"ElioT {self._eui}",
+                data={
+                    CONF_USERNAME: self._username,
+                    CONF_PASSWORD: self._password,
+                    CONF_EUI: self._eui,
+                },
+            )
+
+        return self.async_show_form(
+            step_id="discovery_confirm",
+            description_placeholders={"eui": self._eui},
+        )
+
 
 class OptionsFlowHandler(OptionsFlowWithConfigEntry):
     """Handle options flow for ElioT."""
@@ -10,6 +10,10 @@ API_DEVICES_ENDPOINT = "https://app.visionq.cz/api/account_devices.php"
 DEFAULT_SCAN_INTERVAL = 1800  # 30 minutes in seconds
 MIN_SCAN_INTERVAL = 900  # 15 minutes minimum
 MAX_SCAN_INTERVAL = 86400  # 24 hours maximum (1440 minutes)
+DISCOVERY_INTERVAL = 3600  # 1 hour between account device list checks
+
+# hass.data key for per-account discovery coordinators
+DATA_ACCOUNTS = f"{DOMAIN}_accounts"
 
 # Sensor Keys from API
 SENSOR_HIGH_RATE = "high_rate_kwh"
@@ -1,23 +1,30 @@
 """DataUpdateCoordinator for ElioT."""
+from collections.abc import Callable
 from datetime import timedelta
+import hashlib
 import logging
 from typing import Any
 
 import aiohttp
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import SOURCE_INTEGRATION_DISCOVERY, ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import discovery_flow
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
 from .const import (
+    API_DEVICES_ENDPOINT,
     API_ENDPOINT,
     CONF_EUI,
     CONF_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
+    DISCOVERY_INTERVAL,
+    DOMAIN,
     SENSOR_HIGH_RATE,
     SENSOR_LOW_RATE,
     SENSOR_TIMESTAMP,
@@ -41,8 +48,11 @@ class EliotDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.username = entry.data[CONF_USERNAME]
         self.password = entry.data[CONF_PASSWORD]
 
+        # Set when the device disappears from the account device list
+        self.device_removed = False
+
         # Get scan interval from options, fallback to default
-        scan_interval = entry.options.get(
+        self._scan_interval = entry.options.get(
             CONF_SCAN_INTERVAL,
             DEFAULT_SCAN_INTERVAL
         )
@@ -51,12 +61,65 @@ class EliotDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass,
             _LOGGER,
             name=f"ElioT {self.eui}",
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=timedelta(seconds=self._scan_interval),
         )
 
     def update_interval_seconds(self, interval: int) -> None:
         """Update the polling interval."""
-        self.update_interval = timedelta(seconds=interval)
+        self._scan_interval = interval
+
+        # Polling stays stopped while the device is missing from the account
+        if not self.device_removed:
+            self.update_interval = timedelta(seconds=interval)
+
+    @callback
+    def async_set_device_removed(self, removed: bool) -> None:
+        """Stop polling a device that left the account, or resume it."""
+        self.device_removed = removed
+
+        if removed:
+            self.update_interval = None
+            self._unschedule_refresh()
+            self.last_update_success = False
+            self.async_update_listeners()
+            return
+
+        self.update_interval = timedelta(seconds=self._scan_interval)
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def async_attach_account(
+        self, account: "EliotAccountCoordinator"
+    ) -> Callable[[], None]:
+        """Follow the account device list and return an unsubscribe callback."""
+
+        @callback
+        def _handle_account_update() -> None:
+            """Stop or resume polling when the device leaves or rejoins."""
+            if not account.last_update_success or account.data is None:
+                return
+
+            present = self.eui in account.data
+            if present != self.device_removed:
+                return
+
+            if not present:
+                _LOGGER.warning(
+                    "Device %s is no longer on the account, stopping updates",
+                    self.eui,
+                )
+            else:
+                _LOGGER.info(
+                    "Device %s is back on the account, resuming updates", self.eui
+                )
+            self.async_set_device_removed(not present)
+
+        unsub = account.async_add_listener(_handle_account_update)
+
+        # The account list may already be known, so check it right away
+        _handle_account_update()
+
+        return unsub
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API endpoint."""
@@ -98,3 +161,111 @@ class EliotDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             raise
         except Exception as err:
             raise UpdateFailed(f"Unexpected error: {err}") from err
+
+
+class EliotAccountCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
+    """Class to track the device list of a VISIONQ.CZ account.
+
+    One instance is shared by all config entries of the same account, so the
+    device list costs a single request per account per cycle.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        username: str,
+        password: str,
+    ) -> None:
+        """Initialize the coordinator."""
+        self.username = username
+        self.password = password
+        self.entry_ids: set[str] = set()
+        self._devices_hash: str | None = None
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            # Shared by several entries, so not tied to any single one
+            config_entry=None,
+            name=f"ElioT account {username}",
+            update_interval=timedelta(seconds=DISCOVERY_INTERVAL),
+            # Listeners are only notified when the device set changes
+            always_update=False,
+        )
+
+    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+        """Fetch the account device list and diff it by EUI."""
+        try:
+            auth = aiohttp.BasicAuth(self.username, self.password)
+            session = async_get_clientsession(self.hass)
+            async with session.get(
+                API_DEVICES_ENDPOINT,
+                auth=auth,
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                if response.status != 200:
+                    raise UpdateFailed(
+                        f"Error fetching device list: HTTP {response.status}"
+                    )
+
+                data = await response.json()
+
+            if not isinstance(data, dict) or "devices" not in data:
+                raise UpdateFailed("API returned unexpected response format")
+
+            devices = {
+                str(device["eui"]): device
+                for device in data["devices"]
+                if isinstance(device, dict) and device.get("eui")
+            }
+
+        except aiohttp.ClientError as err:
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
+        except UpdateFailed:
+            raise
+        except Exception as err:
+            raise UpdateFailed(f"Unexpected error: {err}") from err
+
+        # Compare a digest of the sorted EUIs so unchanged lists are cheap
+        devices_hash = hashlib.sha256(
+            "\n".join(sorted(devices)).encode()
+        ).hexdigest()
+        if devices_hash == self._devices_hash and self.data is not None:
+            return self.data
+
+        previous = set(self.data or {})
+        added = set(devices) - previous
+        removed = previous - set(devices)
+        self._devices_hash = devices_hash
+
+        if removed:
+            _LOGGER.info(
+                "Devices removed from account %s: %s",
+                self.username,
+                ", ".join(sorted(removed)),
+            )
+
+        self._async_discover_devices(added)
+
+        return devices
+
+    @callback
+    def _async_discover_devices(self, euis: set[str]) -> None:
+        """Start a discovery flow for every device not configured yet."""
+        configured = {
+            entry.unique_id
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+        }
+
+        for eui in sorted(euis - configured):
+            _LOGGER.debug("Discovered new device %s on account %s", eui, self.username)
+            discovery_flow.async_create_flow(
+                self.hass,
+                DOMAIN,
+                context={"source": SOURCE_INTEGRATION_DISCOVERY},
+                data={
+                    CONF_USERNAME: self.username,
+                    CONF_PASSWORD: self.password,
+                    CONF_EUI: eui,
+                },
+            )